@@ -1,5 +1,6 @@
 from .client import (
     YaraClient,
+    AsyncYaraClient,
     YaraError,
     YaraConnectionError,
     YaraNotFoundError,
@@ -9,9 +10,10 @@ from .client import (
 
 __all__ = [
     "YaraClient",
+    "AsyncYaraClient",
     "YaraError",
     "YaraConnectionError",
     "YaraNotFoundError",
     "YaraConflictError",
     "YaraBadRequestError"
-]
\ No newline at end of file
+]
@@ -1,18 +1,71 @@
-import requests
+import asyncio
+import gzip
+import threading
 import uuid
-from typing import Any, Dict, List, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Any, Dict, List, Tuple, Union, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, only needed for AsyncYaraClient
+    aiohttp = None
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional dependency, only needed for streaming parses
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, stdlib json works too
+    orjson = None
+
+_USER_AGENT = "yaradb-client-py/0.1.4"
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    import json as _json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj).encode("utf-8")
+
+    _json_loads = _json.loads
+
+
+def _id_str(doc_id: Union[str, uuid.UUID], _str=str) -> str:
+    # Ids are usually already strings; only UUID instances pay for str()
+    return doc_id if type(doc_id) is _str else _str(doc_id)
 
 
 class YaraError(Exception):
+    # The display string is built lazily in __str__, so exceptions that get
+    # caught and discarded never pay for the formatting
     def __init__(self, message: str, status_code: int | None = None):
         self.message = message
         self.status_code = status_code
-        super().__init__(f"Status code: {status_code}, Error: {message}")
+        super().__init__(message, status_code)
+
+    def __str__(self) -> str:
+        return f"Status code: {self.status_code}, Error: {self.message}"
 
 
 class YaraConnectionError(YaraError):
     def __init__(self, host: str, original_error: Exception):
-        super().__init__(f"Failed to connect to {host}. Is the server running? Error: {original_error}", None)
+        self.host = host
+        self.original_error = original_error
+        self.status_code = None
+        Exception.__init__(self, host, original_error)
+
+    @property
+    def message(self) -> str:
+        return f"Failed to connect to {self.host}. Is the server running? Error: {self.original_error}"
 
 
 class YaraNotFoundError(YaraError):
@@ -30,56 +83,714 @@ class YaraBadRequestError(YaraError):
     pass
 
 
+_EXC_MAP = {
+    404: YaraNotFoundError,
+    409: YaraConflictError,
+    400: YaraBadRequestError,
+    422: YaraBadRequestError,
+}
+
+# Error bodies should be tiny ({"detail": ...}); cap how much of a
+# pathological one gets decoded
+_ERROR_BODY_CAP = 65536
+
+
+class _ChainedReader:
+    """
+    File-like that replays a few peeked bytes before the underlying stream,
+    used to sniff the shape of a streamed JSON body without losing data.
+    """
+
+    def __init__(self, head: bytes, stream: Any):
+        self._head = head
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if self._head:
+            if size < 0:
+                head, self._head = self._head, b""
+                return head + self._stream.read(size)
+            head = self._head[:size]
+            self._head = self._head[len(head):]
+            return head
+        return self._stream.read(size)
+
+
+class _TTLCache:
+    """
+    Minimal thread-safe TTL cache: a dict of key -> (expires_at, snapshot)
+    with lazy expiry. Values are stored as serialized JSON snapshots and
+    decoded fresh on every hit, so callers can mutate what they get back
+    without poisoning the cache. Kept in-module so the client has no extra
+    dependency.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 2.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if monotonic() >= expires_at:
+                del self._data[key]
+                return None
+        return _json_loads(snapshot)
+
+    def set(self, key: Any, value: Any) -> None:
+        snapshot = _json_dumps(value)
+        with self._lock:
+            data = self._data
+            if len(data) >= self.maxsize:
+                now = monotonic()
+                for stale in [k for k, (expires_at, _) in data.items() if expires_at <= now]:
+                    del data[stale]
+                while len(data) >= self.maxsize:  # still full: drop oldest inserts
+                    del data[next(iter(data))]
+            data[key] = (monotonic() + self.ttl, snapshot)
+
+    def invalidate(self, key: Any = None) -> None:
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+
 # --- Client ---
 
 class YaraClient:
-    def __init__(self, host: str = "http://127.0.0.1:8000"):
+    def __init__(
+        self,
+        host: str = "http://127.0.0.1:8000",
+        transport: str = "requests",
+        cache_ttl: float = 2.0,
+        warmup: bool = False,
+        compress_threshold: int = -1
+    ):
+        """
+        :param host: Base URL of the YaraDB server
+        :param transport: 'requests' (HTTP/1.1, default) or 'httpx2' (HTTP/2
+            stream multiplexing via the optional httpx dependency)
+        :param cache_ttl: Seconds that get/get_table/list_tables results stay
+            cached client-side. Cache hits return a fresh copy, so mutating
+            a returned document never affects later reads. Writes through
+            this client invalidate the affected entries, but writes from
+            other processes may be seen up to cache_ttl late. Pass 0 to
+            disable caching.
+        :param warmup: If True, opens a connection to the server right away
+            so the first real call skips the TCP/TLS handshake. Best-effort;
+            a server that is down does not fail construction.
+        :param compress_threshold: Gzip request bodies larger than this many
+            bytes and mark them Content-Encoding: gzip. 0 compresses every
+            body, -1 (default) never compresses. Only enable against servers
+            that decompress gzip request bodies.
+        """
         self.host = host.rstrip('/')
-        self.session = requests.Session()
+        self.transport = transport
+        self.compress_threshold = compress_threshold
+        self._cache = _TTLCache(maxsize=1024, ttl=cache_ttl) if cache_ttl > 0 else None
+        # ETag store for conditional GETs; entries stay valid until the
+        # server says otherwise, so this is kept separate from the TTL cache
+        self._etags: Dict[Any, Any] = {}
+        self._etags_lock = threading.Lock()
+        # Static headers set once here instead of being rebuilt per request
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": _USER_AGENT
+        }
+        if transport == "httpx2":
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    "httpx is required for transport='httpx2'. Install it with: pip install httpx[http2]"
+                )
+            # One HTTP/2 connection multiplexes concurrent requests; no
+            # Connection header here since it is illegal on HTTP/2
+            self.session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                headers=headers
+            )
+            self._conn_errors = (httpx.TransportError,)
+            self._timeout_errors = (httpx.TimeoutException,)
+            self._body_kw = "content"  # httpx takes raw bytes as content=
+        elif transport == "requests":
+            self.session = requests.Session()
+            # Larger pool keeps connections alive under multi-threaded use,
+            # and retries cover transient gateway errors on idempotent-safe methods
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset(["GET", "PUT", "POST", "DELETE"]),
+                    # hand the exhausted-retry response back so it surfaces
+                    # as the usual YaraError, not urllib3's RetryError
+                    raise_on_status=False
+                )
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            headers["Connection"] = "keep-alive"
+            self.session.headers.update(headers)
+            self._conn_errors = (requests.ConnectionError,)
+            self._timeout_errors = (requests.Timeout,)
+            self._body_kw = "data"
+        else:
+            raise ValueError(f"Unknown transport: {transport!r} (expected 'requests' or 'httpx2')")
+
+        # Endpoint URLs are fixed once the host is known; build them all here
+        # so no method re-runs f-string formatting per call
+        self._ping_url = self.host + "/ping"
+        self._doc_create_url = self.host + "/document/create"
+        self._bulk_create_url = self.host + "/document/bulk_create"
+        self._find_url = self.host + "/document/find"
+        self._combine_url = self.host + "/document/combine"
+        self._doc_get = self.host + "/document/get/"
+        self._doc_update = self.host + "/document/update/"
+        self._doc_archive = self.host + "/document/archive/"
+        self._table_create_url = self.host + "/table/create"
+        self._table_list_url = self.host + "/table/list"
+        self._table_prefix = self.host + "/table/"
+        self._self_destruct_url = self.host + "/system/self-destruct"
+
+        self._specialize_request()
+
+        if warmup:
+            try:
+                self.session.head(self._ping_url, timeout=1)
+            except self._conn_errors + self._timeout_errors:
+                pass
 
     def _handle_response(self, response: requests.Response) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Handles HTTP response and raises exceptions on errors.
         Returns JSON data (dict or list) on success.
         """
-        if response.status_code == 200:
+        status = response.status_code
+        if status == 200:
+            try:
+                return _json_loads(response.content)
+            except ValueError:
+                raise YaraError("Invalid JSON response from server", status)
+
+        raw = response.content[:_ERROR_BODY_CAP]
+        try:
+            response_json = _json_loads(raw)
+            if isinstance(response_json, dict):
+                error_detail = response_json.get("detail", "Unknown API error")
+            else:
+                error_detail = str(response_json)
+        except ValueError:
+            error_detail = raw.decode("utf-8", "replace") or "Unknown API error"
+
+        if status == 422:
+            error_detail = f"Validation Error: {error_detail}"
+        raise _EXC_MAP.get(status, YaraError)(error_detail, status)
+
+    def _encode_body(self, body: bytes) -> Tuple[bytes, Optional[Dict[str, str]]]:
+        """
+        Applies the compress_threshold policy to a serialized body, returning
+        the bytes to send plus the extra headers (or None). The single place
+        where request compression happens.
+        """
+        if 0 <= self.compress_threshold < len(body):
+            return gzip.compress(body, compresslevel=1), {"Content-Encoding": "gzip"}
+        return body, None
+
+    def _specialize_request(self) -> None:
+        """
+        Builds the per-instance request function: sends one request and
+        funnels the response through _handle_response, translating
+        transport-level connection failures into YaraConnectionError.
+        raw sends pre-serialized JSON bytes verbatim instead of payload.
+        The session call, response handler and transport constants are fixed
+        at construction time, so they are captured as closure locals and the
+        resulting function is bound as self._request — every request then
+        skips the repeated attribute lookups.
+        """
+        session_request = self.session.request
+        handle = self._handle_response
+        body_kw = self._body_kw
+        conn_errors = self._conn_errors
+        host = self.host
+        dumps = _json_dumps
+        encode_body = self._encode_body
+
+        def _request(
+            method: str,
+            url: str,
+            *,
+            payload: Any = None,
+            raw: Optional[bytes] = None,
+            params: Optional[Dict[str, Any]] = None,
+            timeout: Optional[float] = None
+        ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+            kwargs: Dict[str, Any] = {}
+            body = raw if raw is not None else (dumps(payload) if payload is not None else None)
+            if body is not None:
+                body, headers = encode_body(body)
+                if headers is not None:
+                    kwargs["headers"] = headers
+                kwargs[body_kw] = body
+            if params is not None:
+                kwargs["params"] = params
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            try:
+                return handle(session_request(method, url, **kwargs))
+            except conn_errors as e:
+                raise YaraConnectionError(host, e)
+
+        self._request = _request
+
+    def _cache_invalidate(self, *keys: Any) -> None:
+        if self._cache is not None:
+            for key in keys:
+                self._cache.invalidate(key)
+        with self._etags_lock:
+            for key in keys:
+                self._etags.pop(key, None)
+
+    def _conditional_get(self, key: Any, url: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        GET revalidated with If-None-Match when an ETag is on hand: a 304
+        answer is headers-only and the remembered body is re-decoded and
+        returned. The store keeps the raw response bytes, not the decoded
+        object, so documents a caller mutated are never served back.
+        Servers that send no ETag get a plain GET.
+        """
+        entry = self._etags.get(key)
+        try:
+            if entry is not None:
+                response = self.session.request("GET", url, headers={"If-None-Match": entry[0]})
+            else:
+                response = self.session.request("GET", url)
+        except self._conn_errors as e:
+            raise YaraConnectionError(self.host, e)
+
+        if response.status_code == 304 and entry is not None:
+            return _json_loads(entry[1])
+        result = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            etags = self._etags
+            with self._etags_lock:
+                if len(etags) >= 1024 and key not in etags:
+                    etags.pop(next(iter(etags)), None)
+                etags[key] = (etag, response.content)
+        elif entry is not None:
+            self._etags.pop(key, None)
+        return result
+
+    def ping(self) -> bool:
+        try:
+            # HEAD keeps the health loop body-free; older servers that
+            # reject HEAD on /ping get the original GET + status check
+            response = self.session.head(self._ping_url, timeout=3)
+            if response.status_code not in (405, 501):
+                return response.status_code == 200
+            response = self.session.get(self._ping_url, timeout=3)
+            return response.status_code == 200 and _json_loads(response.content).get("status") == "alive"
+        except self._conn_errors + self._timeout_errors:
+            return False
+
+    # --- Document Operations ---
+
+    def create(
+        self,
+        table_name: str,
+        name: str,
+        body: Optional[Dict[str, Any]] = None,
+        *,
+        body_bytes: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """
+        Creates a new document in the specified table.
+        :param table_name: Name of the table (required in v3.0)
+        :param name: Name of the document
+        :param body: Document content
+        :param body_bytes: Document content as ready-made JSON bytes, sent
+            verbatim instead of body — skips a decode/re-encode round-trip
+            when the payload already exists in serialized form
+        """
+        url = self._doc_create_url
+        if body_bytes is not None:
+            envelope = (b'{"table_name":' + _json_dumps(table_name)
+                        + b',"name":' + _json_dumps(name)
+                        + b',"body":' + body_bytes + b'}')
+            result = self._request("POST", url, raw=envelope)
+        elif body is not None:
+            payload = {
+                "table_name": table_name,
+                "name": name,
+                "body": body
+            }
+            result = self._request("POST", url, payload=payload)
+        else:
+            raise TypeError("create() requires either body or body_bytes")
+        self._cache_invalidate(("tbl", table_name), ("tbls",))
+        return result  # type: ignore
+
+    def bulk_create(self, table_name: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Creates many documents in one round-trip via /document/bulk_create.
+        Falls back to concurrent per-item creation over the pooled session
+        when the server does not expose the bulk endpoint.
+        :param table_name: Name of the table
+        :param items: List of {"name": ..., "body": ...} dicts
+        """
+        url = self._bulk_create_url
+        body, headers = self._encode_body(_json_dumps({"table_name": table_name, "items": items}))
+        try:
+            response = self.session.post(url, headers=headers, **{self._body_kw: body})
+            if response.status_code != 404:
+                result = self._handle_response(response)
+                self._cache_invalidate(("tbl", table_name), ("tbls",))
+                return result  # type: ignore
+        except self._conn_errors as e:
+            raise YaraConnectionError(self.host, e)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [
+                pool.submit(self.create, table_name, item["name"], item["body"])
+                for item in items
+            ]
+            return [future.result() for future in futures]
+
+    def get(self, doc_id: Union[str, uuid.UUID]) -> Dict[str, Any]:
+        doc_id = _id_str(doc_id)
+        if self._cache is not None:
+            cached = self._cache.get(("doc", doc_id))
+            if cached is not None:
+                return cached
+        result = self._conditional_get(("doc", doc_id), self._doc_get + doc_id)
+        if self._cache is not None:
+            self._cache.set(("doc", doc_id), result)
+        return result  # type: ignore
+
+    def find(self, filter_body: Dict[str, Any], include_archived: bool = False) -> List[Dict[str, Any]]:
+        return list(self.iter_find(filter_body, include_archived))
+
+    def iter_find(self, filter_body: Dict[str, Any], include_archived: bool = False):
+        """
+        Streaming variant of find(): yields matching documents one by one
+        while the response body is still arriving, so memory stays bounded
+        for large result sets. Incremental parsing needs the optional ijson
+        dependency and the default 'requests' transport; otherwise the full
+        body is parsed before yielding.
+        """
+        url = self._find_url
+        params = {"include_archived": include_archived}
+        if ijson is None or self.transport != "requests":
+            # httpx exposes streaming through a different API; parse in full there
+            yield from self._request("POST", url, payload=filter_body, params=params)  # type: ignore
+            return
+
+        try:
+            response = self.session.post(url, data=_json_dumps(filter_body), params=params, stream=True)
+        except self._conn_errors as e:
+            raise YaraConnectionError(self.host, e)
+        if response.status_code != 200:
+            self._handle_response(response)  # always raises for non-200
+        # Hand ijson the raw file-like so nothing buffers the whole body;
+        # decode_content lets urllib3 un-gzip transparently first
+        response.raw.decode_content = True
+        try:
+            yield from ijson.items(response.raw, "item")
+        except ijson.JSONError:
+            raise YaraError("Invalid JSON response from server", 200)
+        finally:
+            response.close()
+
+    def update(
+        self,
+        doc_id: Union[str, uuid.UUID],
+        version: int,
+        body: Optional[Dict[str, Any]] = None,
+        *,
+        body_bytes: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        doc_id = _id_str(doc_id)
+        if body_bytes is not None:
+            envelope = b'{"version":' + _json_dumps(version) + b',"body":' + body_bytes + b'}'
+            result = self._request("PUT", self._doc_update + doc_id, raw=envelope)
+        elif body is not None:
+            payload = {"version": version, "body": body}
+            result = self._request("PUT", self._doc_update + doc_id, payload=payload)
+        else:
+            raise TypeError("update() requires either body or body_bytes")
+        self._cache_invalidate(("doc", doc_id))
+        return result  # type: ignore
+
+    def archive(self, doc_id: Union[str, uuid.UUID]) -> Dict[str, Any]:
+        doc_id = _id_str(doc_id)
+        result = self._request("PUT", self._doc_archive + doc_id)
+        self._cache_invalidate(("doc", doc_id))
+        return result  # type: ignore
+
+    def combine(self, document_ids: List[Union[str, uuid.UUID]], name: str, merge_strategy: str = "overwrite") -> Dict[str, Any]:
+        url = self._combine_url
+        payload = {
+            "name": name,
+            # map() runs the id conversion as a C loop
+            "document_ids": list(map(_id_str, document_ids)),
+            "merge_strategy": merge_strategy
+        }
+        return self._request("POST", url, payload=payload)  # type: ignore
+
+    # --- Table Operations (New in v3.0) ---
+
+    def create_table(
+        self,
+        name: str,
+        mode: str = "free",
+        schema: Optional[Dict[str, Any]] = None,
+        unique_fields: Optional[List[str]] = None,
+        read_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Creates a new table with specific configuration.
+        :param name: Table name
+        :param mode: 'free' (schemaless) or 'strict' (enforces schema)
+        :param schema: JSON Schema definition (required for strict mode)
+        :param unique_fields: List of fields that must be unique
+        :param read_only: If True, table accepts no writes
+        """
+        url = self._table_create_url
+        payload = {
+            "name": name,
+            "mode": mode,
+            "read_only": read_only
+        }
+        if schema:
+            payload["schema_definition"] = schema
+        if unique_fields:
+            payload["unique_fields"] = unique_fields
+
+        result = self._request("POST", url, payload=payload)
+        self._cache_invalidate(("tbl", name), ("tbls",))
+        return result  # type: ignore
+
+    def list_tables(self) -> List[Dict[str, Any]]:
+        if self._cache is not None:
+            cached = self._cache.get(("tbls",))
+            if cached is not None:
+                return cached
+        result = self._request("GET", self._table_list_url)
+        if self._cache is not None:
+            self._cache.set(("tbls",), result)
+        return result  # type: ignore
+
+    def get_table(self, name: str) -> Dict[str, Any]:
+        if self._cache is not None:
+            cached = self._cache.get(("tbl", name))
+            if cached is not None:
+                return cached
+        result = self._conditional_get(("tbl", name), self._table_prefix + name)
+        if self._cache is not None:
+            self._cache.set(("tbl", name), result)
+        return result  # type: ignore
+
+    def delete_table(self, name: str) -> Dict[str, Any]:
+        result = self._request("DELETE", self._table_prefix + name)
+        self._cache_invalidate(("tbl", name), ("tbls",))
+        return result  # type: ignore
+
+    def get_table_documents(self, name: str) -> List[Dict[str, Any]]:
+        url = self._table_prefix + name + "/documents"
+        return self._request("GET", url)  # type: ignore
+
+    def iter_table_documents(self, name: str, page_size: int = 500):
+        """
+        Streams a table's documents one by one with constant memory, asking
+        the server for cursor pagination (?cursor=&limit=). Servers that
+        ignore pagination and return the plain full array are handled by
+        streaming that single response. With ijson and the default transport
+        each page is parsed incrementally off the wire; otherwise pages are
+        parsed in full. Either way the next cursor is taken from the
+        X-Next-Cursor header when present, falling back to a next_cursor
+        body field.
+        """
+        url = self._table_prefix + name + "/documents"
+        cursor = None
+        while True:
+            params: Dict[str, Any] = {"limit": page_size}
+            if cursor:
+                params["cursor"] = cursor
+
+            if ijson is None or self.transport != "requests":
+                # the GET goes through the session directly rather than
+                # _request so the pagination headers stay visible
+                try:
+                    response = self.session.get(url, params=params)
+                except self._conn_errors as e:
+                    raise YaraConnectionError(self.host, e)
+                page = self._handle_response(response)
+                if isinstance(page, list):  # server ignored pagination
+                    yield from page
+                    return
+                yield from page.get("items", [])
+                cursor = response.headers.get("X-Next-Cursor") or page.get("next_cursor")
+                if not cursor:
+                    return
+                continue
+
+            try:
+                response = self.session.get(url, params=params, stream=True)
+            except self._conn_errors as e:
+                raise YaraConnectionError(self.host, e)
+            if response.status_code != 200:
+                self._handle_response(response)  # always raises for non-200
+            response.raw.decode_content = True
+            first = response.raw.read(1)
+            while first and first.isspace():
+                first = response.raw.read(1)
+            # bare array means an unpaginated server; dict pages wrap the
+            # documents as {"items": [...]}
+            bare = first == b"["
+            cursor = response.headers.get("X-Next-Cursor")
+            try:
+                if bare:
+                    yield from ijson.items(_ChainedReader(first, response.raw), "item")
+                else:
+                    # one event-level pass both yields the documents and
+                    # picks up a next_cursor body key for servers that do
+                    # not send the header
+                    builder = None
+                    for prefix, event, value in ijson.parse(_ChainedReader(first, response.raw)):
+                        if builder is not None:
+                            builder.event(event, value)
+                            if event == "end_map" and prefix == "items.item":
+                                yield builder.value
+                                builder = None
+                        elif event == "start_map" and prefix == "items.item":
+                            builder = ijson.ObjectBuilder()
+                            builder.event(event, value)
+                        elif prefix == "next_cursor" and cursor is None:
+                            cursor = value
+            except ijson.JSONError:
+                raise YaraError("Invalid JSON response from server", 200)
+            finally:
+                response.close()
+            if bare or not cursor:
+                return
+
+    # --- System Operations ---
+
+    def self_destruct(self, verification_phrase: str, safety_pin: int, confirm: bool = True) -> Dict[str, Any]:
+        """
+        Wipes all data from the database. USE WITH CAUTION.
+        :param verification_phrase: Must be 'BDaray'
+        :param safety_pin: Usually (Current Year + 1)
+        """
+        url = self._self_destruct_url
+        payload = {
+            "verification_phrase": verification_phrase,
+            "safety_pin": safety_pin,
+            "confirm": confirm
+        }
+        result = self._request("DELETE", url, payload=payload)
+        if self._cache is not None:
+            self._cache.invalidate()
+        with self._etags_lock:
+            self._etags.clear()
+        return result  # type: ignore
+
+
+# --- Async Client ---
+
+class AsyncYaraClient:
+    """
+    Asynchronous counterpart of YaraClient built on aiohttp.
+    All operations mirror the sync client but run on an event loop,
+    so many requests can be in flight at once on one connection pool.
+    Requires the optional 'aiohttp' dependency.
+
+    Usage:
+        async with AsyncYaraClient() as client:
+            doc = await client.create("users", "alice", {"age": 25})
+    """
+
+    def __init__(self, host: str = "http://127.0.0.1:8000"):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncYaraClient. Install it with: pip install aiohttp"
+            )
+        self.host = host.rstrip('/')
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # Created lazily so the client can be constructed outside a running loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncYaraClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _handle_response(self, response: "aiohttp.ClientResponse") -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Async variant of YaraClient._handle_response: awaits the body
+        and raises the same exception hierarchy on errors.
+        """
+        if response.status == 200:
             try:
-                return response.json()
-            except requests.JSONDecodeError:
-                raise YaraError("Invalid JSON response from server", response.status_code)
+                return await response.json()
+            except (aiohttp.ContentTypeError, ValueError):
+                raise YaraError("Invalid JSON response from server", response.status)
 
         try:
-            response_json = response.json()
+            response_json = await response.json()
             if isinstance(response_json, dict):
                 error_detail = response_json.get("detail", "Unknown API error")
             else:
                 error_detail = str(response_json)
-        except requests.JSONDecodeError:
-            error_detail = response.text or "Unknown API error"
+        except (aiohttp.ContentTypeError, ValueError):
+            error_detail = (await response.text()) or "Unknown API error"
 
-        if response.status_code == 404:
+        if response.status == 404:
             raise YaraNotFoundError(error_detail, 404)
-        elif response.status_code == 409:
+        elif response.status == 409:
             raise YaraConflictError(error_detail, 409)
-        elif response.status_code == 400:
+        elif response.status == 400:
             raise YaraBadRequestError(error_detail, 400)
-        elif response.status_code == 422:
+        elif response.status == 422:
             raise YaraBadRequestError(f"Validation Error: {error_detail}", 422)
         else:
-            raise YaraError(error_detail, response.status_code)
+            raise YaraError(error_detail, response.status)
 
-    def ping(self) -> bool:
+    async def ping(self) -> bool:
         try:
-            response = self.session.get(f"{self.host}/ping", timeout=3)
-            return response.status_code == 200 and response.json().get("status") == "alive"
-        except requests.ConnectionError:
-            return False
-        except requests.Timeout:
+            session = self._get_session()
+            async with session.get(f"{self.host}/ping", timeout=aiohttp.ClientTimeout(total=3)) as response:
+                return response.status == 200 and (await response.json()).get("status") == "alive"
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
             return False
 
     # --- Document Operations ---
 
-    def create(self, table_name: str, name: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    async def create(self, table_name: str, name: str, body: Dict[str, Any]) -> Dict[str, Any]:
         """
         Creates a new document in the specified table.
         :param table_name: Name of the table (required in v3.0)
@@ -93,46 +804,57 @@ class YaraClient:
             "body": body
         }
         try:
-            response = self.session.post(url, json=payload)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().post(url, json=payload) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def get(self, doc_id: Union[str, uuid.UUID]) -> Dict[str, Any]:
+    async def bulk_create(self, table_name: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Creates many documents concurrently on one event loop.
+        :param table_name: Name of the table
+        :param items: List of {"name": ..., "body": ...} dicts
+        """
+        return list(await asyncio.gather(
+            *(self.create(table_name, item["name"], item["body"]) for item in items)
+        ))
+
+    async def get(self, doc_id: Union[str, uuid.UUID]) -> Dict[str, Any]:
         url = f"{self.host}/document/get/{str(doc_id)}"
         try:
-            response = self.session.get(url)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().get(url) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def find(self, filter_body: Dict[str, Any], include_archived: bool = False) -> List[Dict[str, Any]]:
+    async def find(self, filter_body: Dict[str, Any], include_archived: bool = False) -> List[Dict[str, Any]]:
         url = f"{self.host}/document/find"
-        params = {"include_archived": include_archived}
+        # aiohttp rejects bool query params, so serialize explicitly
+        params = {"include_archived": "true" if include_archived else "false"}
         try:
-            response = self.session.post(url, json=filter_body, params=params)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().post(url, json=filter_body, params=params) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def update(self, doc_id: Union[str, uuid.UUID], version: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    async def update(self, doc_id: Union[str, uuid.UUID], version: int, body: Dict[str, Any]) -> Dict[str, Any]:
         url = f"{self.host}/document/update/{str(doc_id)}"
         payload = {"version": version, "body": body}
         try:
-            response = self.session.put(url, json=payload)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().put(url, json=payload) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def archive(self, doc_id: Union[str, uuid.UUID]) -> Dict[str, Any]:
+    async def archive(self, doc_id: Union[str, uuid.UUID]) -> Dict[str, Any]:
         url = f"{self.host}/document/archive/{str(doc_id)}"
         try:
-            response = self.session.put(url)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().put(url) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def combine(self, document_ids: List[Union[str, uuid.UUID]], name: str, merge_strategy: str = "overwrite") -> Dict[str, Any]:
+    async def combine(self, document_ids: List[Union[str, uuid.UUID]], name: str, merge_strategy: str = "overwrite") -> Dict[str, Any]:
         url = f"{self.host}/document/combine"
         payload = {
             "name": name,
@@ -140,14 +862,14 @@ class YaraClient:
             "merge_strategy": merge_strategy
         }
         try:
-            response = self.session.post(url, json=payload)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().post(url, json=payload) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    # --- Table Operations (New in v3.0) ---
+    # --- Table Operations ---
 
-    def create_table(
+    async def create_table(
         self,
         name: str,
         mode: str = "free",
@@ -175,46 +897,46 @@ class YaraClient:
             payload["unique_fields"] = unique_fields
 
         try:
-            response = self.session.post(url, json=payload)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().post(url, json=payload) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def list_tables(self) -> List[Dict[str, Any]]:
+    async def list_tables(self) -> List[Dict[str, Any]]:
         url = f"{self.host}/table/list"
         try:
-            response = self.session.get(url)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().get(url) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def get_table(self, name: str) -> Dict[str, Any]:
+    async def get_table(self, name: str) -> Dict[str, Any]:
         url = f"{self.host}/table/{name}"
         try:
-            response = self.session.get(url)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().get(url) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def delete_table(self, name: str) -> Dict[str, Any]:
+    async def delete_table(self, name: str) -> Dict[str, Any]:
         url = f"{self.host}/table/{name}"
         try:
-            response = self.session.delete(url)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().delete(url) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
-    def get_table_documents(self, name: str) -> List[Dict[str, Any]]:
+    async def get_table_documents(self, name: str) -> List[Dict[str, Any]]:
         url = f"{self.host}/table/{name}/documents"
         try:
-            response = self.session.get(url)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().get(url) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
 
     # --- System Operations ---
 
-    def self_destruct(self, verification_phrase: str, safety_pin: int, confirm: bool = True) -> Dict[str, Any]:
+    async def self_destruct(self, verification_phrase: str, safety_pin: int, confirm: bool = True) -> Dict[str, Any]:
         """
         Wipes all data from the database. USE WITH CAUTION.
         :param verification_phrase: Must be 'BDaray'
@@ -227,7 +949,7 @@ class YaraClient:
             "confirm": confirm
         }
         try:
-            response = self.session.request("DELETE", url, json=payload)
-            return self._handle_response(response)  # type: ignore
-        except requests.ConnectionError as e:
+            async with self._get_session().request("DELETE", url, json=payload) as response:
+                return await self._handle_response(response)  # type: ignore
+        except aiohttp.ClientConnectionError as e:
             raise YaraConnectionError(self.host, e)
\ No newline at end of file